@@ -15,55 +15,242 @@ Examples:
 """
 
 import argparse
+import hashlib
+import heapq
+import importlib.metadata
+import importlib.util
+import io
+import json
+import os
+import re
 import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
+from typing import Iterator, Optional, TextIO
 
-import spacy
+# Installed spaCy pipelines are named <lang>_<type>_<genre>_<size>
+MODEL_NAME_PATTERN = re.compile(r"^(en|de|fr|es|pt|it|nl|zh)_.+_(sm|md|lg|trf)$")
+
+# Rendered inspection reports, reused with --cache while nothing has changed
+# (an empty XDG_CACHE_HOME counts as unset, per the XDG spec)
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "inspect-spacy"
+)
+
+
+@lru_cache(maxsize=512)
+def explain_label(label: str) -> str:
+    """Return spaCy's glossary explanation for a label, or an empty string."""
+    import spacy
+
+    return spacy.explain(label) or ""
+
+
+def find_package_dir(package: str) -> Optional[Path]:
+    """Locate an installed package's directory without importing it."""
+    # find_spec imports the parents of dotted names, so only accept top-level ones
+    if not package.isidentifier():
+        return None
+    try:
+        spec = importlib.util.find_spec(package)
+    except (ImportError, ValueError):
+        return None
+    if spec is None or spec.origin is None:
+        return None
+    return Path(spec.origin).parent
+
+
+def read_model_meta(package: str) -> dict:
+    """Read a model package's meta.json without loading the pipeline."""
+    package_dir = find_package_dir(package)
+    if package_dir is None:
+        raise OSError(f"Package '{package}' could not be located")
+
+    meta_file = package_dir / "meta.json"
+    return json.loads(meta_file.read_bytes())
+
+
+def iter_files(root) -> Iterator[os.DirEntry]:
+    """Yield a DirEntry for every file below root using os.scandir."""
+    with os.scandir(root) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from iter_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def find_model_path(model_name: str) -> Optional[Path]:
+    """Locate the files spacy.load would use for model_name, without loading."""
+    if not model_name:
+        return None
+    # Same precedence as spacy.load: an installed package wins over a path
+    try:
+        importlib.metadata.distribution(model_name)
+    except (importlib.metadata.PackageNotFoundError, ValueError):
+        model_path = Path(model_name)
+        return model_path if model_path.exists() else None
+    return find_package_dir(model_name)
+
+
+# Installed packages whose versions affect how a model loads and runs
+SPACY_STACK_PACKAGES = {
+    "blis",
+    "cymem",
+    "murmurhash",
+    "numpy",
+    "preshed",
+    "spacy",
+    "srsly",
+    "thinc",
+    "torch",
+    "transformers",
+}
+
+
+def spacy_stack_versions() -> dict:
+    """Return versions of spaCy and the installed packages it runs on."""
+    versions = {}
+    for d in importlib.metadata.distributions():
+        name = (d.metadata["Name"] or "").lower().replace("_", "-")
+        if name in SPACY_STACK_PACKAGES or name.startswith("spacy-"):
+            versions[name] = d.version
+    return versions
+
+
+def model_cache_key(model_path: Path, verbose: bool) -> dict:
+    """Build the cache key for a model directory and inspection mode."""
+
+    # Any added, removed or modified file changes the count or latest mtime
+    file_count = 0
+    latest_mtime = 0.0
+    for entry in iter_files(model_path):
+        file_count += 1
+        latest_mtime = max(latest_mtime, entry.stat().st_mtime)
+
+    return {
+        "path": str(model_path),
+        "verbose": verbose,
+        "packages": spacy_stack_versions(),
+        # Reports rendered by an older copy of this script are not reused
+        "inspector": os.stat(__file__).st_mtime,
+        "files": file_count,
+        "mtime": latest_mtime,
+    }
+
+
+def cache_file_for(cache_key: dict) -> Path:
+    """Return the cache file holding the report for a model and mode."""
+    digest = hashlib.sha256(
+        f"{cache_key['path']}:{cache_key['verbose']}".encode()
+    ).hexdigest()[:16]
+    return CACHE_DIR / f"{Path(cache_key['path']).name}-{digest}.json"
+
+
+def load_cached_report(cache_key: dict) -> Optional[str]:
+    """Return the cached report for cache_key, or None if missing or stale."""
+    try:
+        cached = json.loads(cache_file_for(cache_key).read_bytes())
+    except (OSError, ValueError):
+        return None
+    if cached.get("key") != cache_key:
+        return None
+    return cached.get("report")
+
+
+def save_cached_report(cache_key: dict, report: str):
+    """Store a rendered report; failing to write the cache is not an error."""
+    cache_file = cache_file_for(cache_key)
+    try:
+        cache_file.parent.mkdir(parents=True, exist_ok=True)
+        cache_file.write_text(json.dumps({"key": cache_key, "report": report}))
+    except OSError:
+        pass
+
+
+def describe_model(model: str) -> str:
+    """Return the --list line for an installed model package."""
+    try:
+        # Only meta.json is needed here; spacy.load would also
+        # deserialize weights and vectors for every model
+        meta = read_model_meta(model)
+    except (OSError, ValueError) as e:
+        return f"   ❌ {model} (installation issue) -- error: {e}"
+
+    size = f"~{meta.get('size', 'Unknown')}"
+    version = meta.get("version", "Unknown")
+    return f"   ✅ {model} (v{version}, {size})"
 
 
 def list_available_models():
     """List all available spaCy models in the current environment."""
-    print("🔍 Searching for installed spaCy models...\n")
+    # Collect the listing and write it to stdout in one go
+    out = io.StringIO()
+    print("🔍 Searching for installed spaCy models...\n", file=out)
+
+    # Distribution names may be normalized (en-core-web-sm), while the
+    # importable package keeps underscores (en_core_web_sm). A set drops
+    # duplicates when the same distribution is visible on several paths.
+    installed_packages = {
+        d.metadata["Name"].replace("-", "_")
+        for d in importlib.metadata.distributions()
+        if d.metadata["Name"]
+    }
+
+    # Filter for spaCy models (they typically follow pattern like en_core_web_sm)
+    spacy_models = [p for p in installed_packages if MODEL_NAME_PATTERN.match(p)]
+
+    if spacy_models:
+        print("📦 Found spaCy models:", file=out)
+        # meta.json reads are I/O bound, so overlap them across threads;
+        # map() keeps the results in sorted order
+        with ThreadPoolExecutor(max_workers=8) as executor:
+            for line in executor.map(describe_model, sorted(spacy_models)):
+                print(line, file=out)
+    else:
+        print("❌ No spaCy models found.", file=out)
+        print(
+            "\n💡 Install a model with: python -m spacy download en_core_web_sm",
+            file=out,
+        )
+
+    sys.stdout.write(out.getvalue())
 
-    try:
-        # Get all installed packages
-        import pkg_resources
-
-        installed_packages = [d.project_name for d in pkg_resources.working_set]
-
-        # Filter for spaCy models (they typically follow pattern like en_core_web_sm)
-        spacy_models = []
-        for package in installed_packages:
-            if any(
-                lang in package
-                for lang in ["en_", "de_", "fr_", "es_", "pt_", "it_", "nl_", "zh_"]
-            ):
-                if any(size in package for size in ["_sm", "_md", "_lg", "_trf"]):
-                    spacy_models.append(package)
-
-        if spacy_models:
-            print("📦 Found spaCy models:")
-            for model in sorted(spacy_models):
-                try:
-                    nlp = spacy.load(model)
-                    size = f"~{nlp.meta.get('size', 'Unknown')}"
-                    version = nlp.meta.get("version", "Unknown")
-                    print(f"   ✅ {model} (v{version}, {size})")
-                except OSError as e:
-                    print(f"   ❌ {model} (installation issue) -- error: {e}")
-        else:
-            print("❌ No spaCy models found.")
-            print("\n💡 Install a model with: python -m spacy download en_core_web_sm")
-
-    except ImportError:
-        print("❌ Could not check installed packages. Make sure spaCy is installed.")
-
-
-def inspect_spacy_model(model_name: str = "en_core_web_sm", verbose: bool = False):
-    """Inspect the specified spaCy model."""
 
+def inspect_spacy_model(
+    model_name: str = "en_core_web_sm", verbose: bool = False, use_cache: bool = False
+):
+    """Inspect the specified spaCy model, optionally reusing a cached report."""
+    # The header names the model as given, so it is never part of the cached report
     print(f"🔍 Inspecting spaCy model: {model_name}\n")
 
+    cache_key = None
+    if use_cache:
+        model_path = find_model_path(model_name)
+        try:
+            if model_path is not None:
+                cache_key = model_cache_key(model_path.resolve(), verbose)
+        except OSError:
+            cache_key = None
+
+        report = load_cached_report(cache_key) if cache_key else None
+        if report is not None:
+            # Nothing was loaded this time, so don't pass the report off as fresh
+            print(
+                "♻️  Cached report: the model was not reloaded "
+                "(run without --cache to check that it still loads)"
+            )
+            sys.stdout.write(report)
+            return True
+
+    # Make sure the header is visible before the (possibly slow) import and load
+    sys.stdout.flush()
+
+    # Imported here so --help and --list don't pay for loading spaCy
+    import spacy
+
     # Load the model
     try:
         nlp = spacy.load(model_name)
@@ -74,123 +261,199 @@ def inspect_spacy_model(model_name: str = "en_core_web_sm", verbose: bool = Fals
         print("\n🔍 Use --list to see available models")
         return False
 
+    # Render into a buffer so the report is written (and cached) in one piece
+    out = io.StringIO()
+    try:
+        write_report(nlp, verbose, out)
+    finally:
+        # A section that fails part-way still leaves the report so far on stdout
+        sys.stdout.write(out.getvalue())
+    report = out.getvalue()
+
+    # Only cache the report under the key if that is really what was loaded
+    if nlp._path is not None and cache_key is not None:
+        key_path = Path(cache_key["path"])
+        loaded_path = Path(nlp._path).resolve()
+        if key_path == loaded_path or key_path in loaded_path.parents:
+            save_cached_report(cache_key, report)
+
+    return True
+
+
+def write_report(nlp, verbose: bool, out: TextIO):
+    """Write the inspection report for a loaded pipeline to out."""
+    # nlp._path is already a Path in current spaCy versions, and None for
+    # pipelines that don't come from disk (e.g. blank:en)
+    model_path = nlp._path
+    if model_path is not None and not isinstance(model_path, Path):
+        model_path = Path(model_path)
+
     # Model location
-    print("\n📍 Model Location:")
-    print(f"   {nlp._path}")
+    print("\n📍 Model Location:", file=out)
+    if model_path is None:
+        print("   in-memory pipeline", file=out)
+    else:
+        print(f"   {model_path}", file=out)
 
     # Model metadata
-    print("\n📊 Model Metadata:")
+    print("\n📊 Model Metadata:", file=out)
     meta = nlp.meta
-    print(f"   Name: {meta['name']}")
-    print(f"   Version: {meta['version']}")
-    print(f"   Description: {meta['description']}")
-    print(f"   Language: {meta['lang']}")
-    print(f"   Pipeline: {meta['pipeline']}")
-    print(f"   Size: ~{meta.get('size', 'Unknown')}")
+    print(f"   Name: {meta['name']}", file=out)
+    print(f"   Version: {meta['version']}", file=out)
+    print(f"   Description: {meta['description']}", file=out)
+    print(f"   Language: {meta['lang']}", file=out)
+    print(f"   Pipeline: {meta['pipeline']}", file=out)
+    print(f"   Size: ~{meta.get('size', 'Unknown')}", file=out)
 
     if verbose:
-        print(f"   License: {meta.get('license', 'Unknown')}")
-        print(f"   Author: {meta.get('author', 'Unknown')}")
-        print(f"   URL: {meta.get('url', 'Unknown')}")
+        print(f"   License: {meta.get('license', 'Unknown')}", file=out)
+        print(f"   Author: {meta.get('author', 'Unknown')}", file=out)
+        print(f"   URL: {meta.get('url', 'Unknown')}", file=out)
 
-    # Pipeline components
-    print("\n🔧 Pipeline Components:")
-    for name, component in nlp.pipeline:
-        print(f"   - {name}: {type(component).__name__}")
+    # Pipeline components, indexed once for the sections below
+    pipes = dict(nlp.pipeline)
+    print("\n🔧 Pipeline Components:", file=out)
+    for name, component in pipes.items():
+        print(f"   - {name}: {type(component).__name__}", file=out)
 
     # Vocabulary stats
-    print("\n📚 Vocabulary:")
-    print(f"   Total tokens: {len(nlp.vocab):,}")
+    print("\n📚 Vocabulary:", file=out)
+    print(f"   Total tokens: {len(nlp.vocab):,}", file=out)
     if nlp.vocab.vectors.shape[0] > 0:
-        print(f"   Vector dimensions: {nlp.vocab.vectors.shape[1]}")
-        print(f"   Vectors available: {nlp.vocab.vectors.shape[0]:,}")
+        print(f"   Vector dimensions: {nlp.vocab.vectors.shape[1]}", file=out)
+        print(f"   Vectors available: {nlp.vocab.vectors.shape[0]:,}", file=out)
     else:
-        print("   Vectors: No word vectors available")
+        print("   Vectors: No word vectors available", file=out)
 
     # Entity types
-    if nlp.has_pipe("ner"):
-        print("\n🏷️  Named Entity Types:")
-        for label in nlp.get_pipe("ner").labels:
-            explanation = spacy.explain(label) or "Entity type"
-            print(f"   - {label}: {explanation}")
+    ner = pipes.get("ner")
+    if ner is not None:
+        print("\n🏷️  Named Entity Types:", file=out)
+        for label in ner.labels:
+            explanation = explain_label(label) or "Entity type"
+            print(f"   - {label}: {explanation}", file=out)
 
     # POS tags
-    if nlp.has_pipe("tagger"):
-        print("\n📝 POS Tags (sample):")
-        pos_tags = list(nlp.get_pipe("tagger").labels)[:10]  # Show first 10
-        for tag in pos_tags:
-            explanation = spacy.explain(tag) or "Part-of-speech tag"
-            print(f"   - {tag}: {explanation}")
-        if len(nlp.get_pipe("tagger").labels) > 10:
-            print(f"   ... and {len(nlp.get_pipe('tagger').labels) - 10} more")
+    tagger = pipes.get("tagger")
+    if tagger is not None:
+        print("\n📝 POS Tags (sample):", file=out)
+        tagger_labels = list(tagger.labels)
+        for tag in tagger_labels[:10]:  # Show first 10
+            explanation = explain_label(tag) or "Part-of-speech tag"
+            print(f"   - {tag}: {explanation}", file=out)
+        if len(tagger_labels) > 10:
+            print(f"   ... and {len(tagger_labels) - 10} more", file=out)
 
     # Test the model
-    print("\n🧪 Model Test:")
+    print("\n🧪 Model Test:", file=out)
     test_text = (
         "Apple Inc. is looking at buying a startup in San Francisco for $1 billion."
     )
-    doc = nlp(test_text)
+    # Only run the components whose output is shown: tokens and entities,
+    # plus POS tags and lemmas in verbose mode. The parser is never needed.
+    if verbose:
+        unused = ["parser"]
+    else:
+        unused = ["parser", "attribute_ruler", "lemmatizer", "tagger"]
+    with nlp.select_pipes(disable=[name for name in unused if name in pipes]):
+        doc = nlp(test_text)
 
-    print(f"   Input: {test_text}")
-    print(f"   Tokens: {[token.text for token in doc]}")
+    print(f"   Input: {test_text}", file=out)
+    # Tokens are separated with " | " so multi-word boundaries stay visible
+    print("   Tokens:", " | ".join(token.text for token in doc), file=out)
     if doc.ents:
-        print(f"   Entities: {[(ent.text, ent.label_) for ent in doc.ents]}")
+        print(
+            "   Entities:",
+            ", ".join(f"{ent.text}/{ent.label_}" for ent in doc.ents),
+            file=out,
+        )
     else:
-        print("   Entities: No entities detected")
+        print("   Entities: No entities detected", file=out)
 
     if verbose:
-        print(f"   POS Tags: {[(token.text, token.pos_) for token in doc]}")
         print(
-            f"   Lemmas: {[(token.text, token.lemma_) for token in doc if token.text != token.lemma_]}"
+            "   POS Tags:",
+            " ".join(f"{token.text}/{token.pos_}" for token in doc),
+            file=out,
         )
+        lemmas = " ".join(
+            f"{token.text}/{token.lemma_}"
+            for token in doc
+            if token.text != token.lemma_
+        )
+        print("   Lemmas:", lemmas or "No lemma changes", file=out)
 
     # File structure inspection (only if verbose)
-    if verbose:
-        print("\n📁 Model File Structure:")
-        model_path = Path(nlp._path)
+    if verbose and model_path is not None:
+        print("\n📁 Model File Structure:", file=out)
 
         def print_tree(path, prefix="", max_depth=3, current_depth=0):
             if current_depth >= max_depth:
                 return
 
+            # DirEntry caches the file type, so is_dir() needs no extra stat
             try:
-                items = sorted(path.iterdir())
-                for i, item in enumerate(items):
-                    is_last = i == len(items) - 1
-                    current_prefix = "└── " if is_last else "├── "
-                    print(f"{prefix}{current_prefix}{item.name}")
-
-                    if item.is_dir() and current_depth < max_depth - 1:
-                        next_prefix = prefix + ("    " if is_last else "│   ")
-                        print_tree(item, next_prefix, max_depth, current_depth + 1)
+                with os.scandir(path) as it:
+                    items = sorted(it, key=lambda e: e.name)
             except PermissionError:
-                print(f"{prefix}└── [Permission Denied]")
+                print(f"{prefix}└── [Permission Denied]", file=out)
+                return
 
-        print_tree(model_path)
+            for i, item in enumerate(items):
+                is_last = i == len(items) - 1
+                current_prefix = "└── " if is_last else "├── "
+                print(f"{prefix}{current_prefix}{item.name}", file=out)
+
+                if current_depth < max_depth - 1 and item.is_dir(follow_symlinks=False):
+                    next_prefix = prefix + ("    " if is_last else "│   ")
+                    print_tree(item.path, next_prefix, max_depth, current_depth + 1)
+
+        print_tree(str(model_path))
+
+        # Sample configuration files
+        print("\n📄 Configuration Files:", file=out)
+        config_file = model_path / "config.cfg"
+        if config_file.exists():
+            print("   config.cfg (first 10 lines):", file=out)
+            try:
+                with open(config_file, "r", encoding="utf8", buffering=64 * 1024) as f:
+                    head = list(islice(f, 10))
+                for line in head:
+                    print(f"   {line.rstrip()}", file=out)
+            except (OSError, UnicodeDecodeError) as e:
+                print(f"   Could not read config.cfg: {e}", file=out)
+
+        # nlp.meta is the already-parsed meta.json
+        print("\n   meta.json (first 5 entries):", file=out)
+        for key, value in islice(meta.items(), 5):
+            print(f"   {key}: {value}", file=out)
 
     # Storage information
-    print("\n💾 Storage Information:")
-    model_path = Path(nlp._path)
+    if model_path is None:
+        return
+
+    print("\n💾 Storage Information:", file=out)
     try:
-        total_size = sum(f.stat().st_size for f in model_path.rglob("*") if f.is_file())
-        print(f"   Total model size: {total_size / (1024*1024):.1f} MB")
+        # Single walk: sum every file and keep only the 5 largest in a min-heap
+        total_size = 0
+        large_files = []
+        for entry in iter_files(model_path):
+            name, size = entry.name, entry.stat().st_size
+            total_size += size
+            if len(large_files) < 5:
+                heapq.heappush(large_files, (size, name))
+            elif size > large_files[0][0]:
+                heapq.heapreplace(large_files, (size, name))
+
+        print(f"   Total model size: {total_size / (1024*1024):.1f} MB", file=out)
 
         if verbose:
             # Largest files
-            large_files = []
-            for f in model_path.rglob("*"):
-                if f.is_file():
-                    size = f.stat().st_size
-                    large_files.append((f.name, size))
-
-            large_files.sort(key=lambda x: x[1], reverse=True)
-            print("\n   Largest files:")
-            for name, size in large_files[:5]:
-                print(f"   - {name}: {size / (1024*1024):.1f} MB")
+            print("\n   Largest files:", file=out)
+            for size, name in sorted(large_files, reverse=True):
+                print(f"   - {name}: {size / (1024*1024):.1f} MB", file=out)
     except Exception as e:
-        print(f"   Could not calculate size: {e}")
-
-    return True
+        print(f"   Could not calculate size: {e}", file=out)
 
 
 def main():
@@ -204,6 +467,7 @@ Examples:
   %(prog)s en_core_web_md            # Inspect specific model
   %(prog)s --list                    # List all available models
   %(prog)s en_core_web_lg --verbose  # Detailed inspection
+  %(prog)s en_core_web_sm --cache    # Reuse the report if nothing changed
         """,
     )
 
@@ -225,6 +489,12 @@ Examples:
         help="Show detailed information including file structure",
     )
 
+    parser.add_argument(
+        "--cache",
+        action="store_true",
+        help="Reuse a cached report instead of loading an unchanged model",
+    )
+
     parser.add_argument(
         "--version", action="version", version="spaCy Model Inspector 1.0.0"
     )
@@ -235,7 +505,7 @@ Examples:
         list_available_models()
         return
 
-    success = inspect_spacy_model(args.model, args.verbose)
+    success = inspect_spacy_model(args.model, args.verbose, args.cache)
 
     if not success:
         sys.exit(1)